@@ -18,13 +18,42 @@ Perhaps best of all, a single Tdb file may contain one—or more—tables.
 import datetime
 import gzip
 import io
-import pathlib
-from xml.sax.saxutils import escape, unescape
+import mmap
+import re
+from xml.sax.saxutils import escape
 
 import editabletuple
 
+try:
+    import rapidgzip # parallel gzip decompression
+except ImportError:
+    rapidgzip = None
+
 __version__ = '0.9.5'
 
+_WS_RE = re.compile(rb'[ \t\r\n]*')
+# Each token pattern also consumes any leading whitespace so that a value
+# costs a single C-level match rather than a skip then a match.
+_INT_RE = re.compile(rb'[ \t\r\n]*([-+0-9]*)')
+_REAL_RE = re.compile(rb'[ \t\r\n]*([-+0-9.eE]*)')
+_DATE_RE = re.compile(rb'[ \t\r\n]*([-0-9]*)')
+_DATETIME_RE = re.compile(rb'[ \t\r\n]*([-0-9T:]*)')
+
+_UNESCAPE_RE = re.compile(r'&(lt|gt|amp|quot|apos|#\d+);')
+_ENTITY = {'lt': '<', 'gt': '>', 'amp': '&', 'quot': '"', 'apos': "'"}
+
+_NL = ord('\n')
+_ONE = ord('1')
+_LBRACKET = ord('[')
+_RBRACKET = ord(']')
+_HYPHEN = ord('-')
+_COLON = ord(':')
+_T_SEP = ord('T')
+
+# maps a byte to 1 if it can occur in an int or real token
+_NUMERIC_CHARS = bytes(1 if i in b'.eE0123456789' else 0
+                       for i in range(256))
+
 
 class Tdb:
 
@@ -32,29 +61,45 @@ class Tdb:
         self.tables = {} # keys are tablenames, values are Tables
 
 
-    def load(self, filename_or_filelike):
+    def load(self, filename_or_filelike, *, parallelization=0):
         '''Reads the given file (or file-like stream) and replaces this
-        Tdb's tables with those read in.'''
-        close = False
-        if isinstance(filename_or_filelike, (str, pathlib.Path)):
-            filename_or_filelike = str(filename_or_filelike)
-            opener = (gzip.open
-                      if filename_or_filelike[-3:].lower().endswith('.gz')
-                      else open)
-            out = opener(filename_or_filelike, 'rt', encoding='utf-8')
-            close = True
+        Tdb's tables with those read in.
+
+        Plain .tdb files are memory-mapped and parsed in place rather
+        than read wholesale into memory. If the rapidgzip module is
+        available .gz files are decompressed in parallel using up to
+        parallelization threads (0 means as many as make sense);
+        otherwise the stdlib's gzip is used and parallelization is
+        ignored.'''
+        if hasattr(filename_or_filelike, 'read'):
+            self.loads(filename_or_filelike.read())
+            return
+        filename = str(filename_or_filelike)
+        if filename[-3:].lower().endswith('.gz'):
+            if rapidgzip is None:
+                file = gzip.open(filename, 'rb')
+            else:
+                file = rapidgzip.open(
+                    filename, parallelization=parallelization)
+            with file:
+                self.loads(file.read())
         else:
-            out = filename_or_filelike
-        try:
-            self.loads(out.read())
-        finally:
-            if close:
-                out.close()
+            with open(filename, 'rb') as file:
+                try:
+                    mapped = mmap.mmap(file.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+                except (ValueError, OSError): # e.g., an empty file
+                    self.loads(file.read())
+                    return
+                with mapped:
+                    self.tables = _read_tdb(mapped)
 
 
     def loads(self, text):
-        '''Reads the given text and replaces this Tdb's tables with those
-        read in.'''
+        '''Reads the given text (str or UTF-8 bytes) and replaces this
+        Tdb's tables with those read in.'''
+        if isinstance(text, str):
+            text = text.encode('utf-8')
         self.tables = _read_tdb(text)
 
 
@@ -64,19 +109,18 @@ class Tdb:
         if not (1 <= decimals <= 19):
             decimals = -1
         close = False
-        if isinstance(filename_or_filelike, (str, pathlib.Path)):
-            filename_or_filelike = str(filename_or_filelike)
-            if filename_or_filelike == '-':
+        if hasattr(filename_or_filelike, 'write'):
+            out = filename_or_filelike
+        else:
+            filename = str(filename_or_filelike)
+            if filename == '-':
                 out = sys.stdout
             else:
-                opener = (
-                    gzip.open
-                    if filename_or_filelike[-3:].lower().endswith('.gz')
-                    else open)
-                out = opener(filename_or_filelike, 'wt', encoding='utf-8')
+                opener = (gzip.open
+                          if filename[-3:].lower().endswith('.gz')
+                          else open)
+                out = opener(filename, 'wt', encoding='utf-8')
             close = True
-        else:
-            out = filename_or_filelike
         try:
             _write_tdb(out, self.tables, decimals)
         finally:
@@ -94,11 +138,11 @@ class Tdb:
             out.close()
 
 
-def load(filename_or_filelike):
+def load(filename_or_filelike, *, parallelization=0):
     '''Reads the given file (or file-like stream) and returns a Tdb with the
     tables that have been read in.'''
     db = Tdb()
-    db.load(filename_or_filelike)
+    db.load(filename_or_filelike, parallelization=parallelization)
     return db
 
 
@@ -113,22 +157,24 @@ def loads(text):
 def _read_tdb(text):
     tables = {}
     table = None
-    lino = 1
-    while text:
-        c = text[0]
-        if c == '\n':
-            lino += 1
-            text = text[1:]
-        elif c == '[':
-            text, table, lino = _read_meta(text[1:], lino)
+    pos = 0
+    size = len(text)
+    while pos < size:
+        c = text[pos]
+        if c == _NL:
+            pos += 1
+        elif c == _LBRACKET: # a table: its metadata then its records
+            pos, table = _read_meta(text, pos + 1)
             tables[table.name] = table
-        else: # read records into the current table
-            text, lino = _read_records(text, table, lino)
+            pos = _read_records(text, pos, table)
+        else: # stray records continue the current table
+            pos = _read_records(text, pos, table)
     return tables
 
 
-def _read_meta(text, lino):
-    found, text, lino = _find(text, '%', 'expected to find "%"', lino)
+def _read_meta(text, pos):
+    start, end, pos = _find(text, pos, b'%', 'expected to find "%"')
+    found = text[start:end].decode('utf-8')
     table = Table()
     fieldname = None
     for i, part in enumerate(found.split()):
@@ -143,182 +189,299 @@ def _read_meta(text, lino):
                 part = part[:-1]
             table.fields_meta.append(MetaField(fieldname, part,
                                                null_allowed=null_allowed))
-    return text, table, lino + 1 # allow for %
-
-
-def _read_records(text, table, lino):
-    record = None
-    old_column = -1
-    column = 0
-    columns = table.columns
-    while text:
-        if record is None:
-            record = table.RecordClass()
-            old_column = -1
-            column = 0
-        if column != old_column:
-            field_meta = table.fields_meta[column]
-            kind = field_meta.kind
-        c = text[0]
-        if c == '\n': # ignore whitespace
-            text = text[1:]
-            lino += 1
-        elif c in ' \t\r': # ignore whitespace
-            text = text[1:]
-        elif c == '?':
-            _handle_null(field_meta, record, column, lino)
-            text, column = _advance(text, column)
-        elif c in 'FfNn':
-            _handle_bool(kind, False, record, column, lino)
-            text, column = _advance(text, column)
-        elif c in 'TtYy':
-            _handle_bool(kind, True, record, column, lino)
-            text, column = _advance(text, column)
-        elif c == '(':
-            text, lino = _handle_bytes(kind, text[1:], record, column, lino)
-            column += 1
-        elif c == '<':
-            text, lino = _handle_str(kind, text[1:], record, column, lino)
-            column += 1
-        elif c == '-':
-            if kind == 'int':
-                text, lino = _handle_int(text, record, column, lino)
-            elif kind == 'real':
-                text, lino = _handle_real(text, record, column, lino)
-            else:
-                raise Error(f'E100#{lino}:expected {kind}')
-            column += 1
-        elif c in '0123456789':
-            if kind == 'bool':
-                if (c in '01' and len(text) > 1 and
-                        text[1] not in '.eE0123456789'):
-                    _handle_bool(kind, c == '1', record, column, lino)
-                    text = text[1:]
-                else:
-                    raise Error(
-                        f'E105#{lino}:got {text[:2]} expected a {kind}')
-            elif kind == 'int':
-                text, lino = _handle_int(text, record, column, lino)
-            elif kind == 'real':
-                text, lino = _handle_real(text, record, column, lino)
-            elif kind == 'date':
-                text, lino = _handle_date(text, record, column, lino)
-            elif kind == 'datetime':
-                text, lino = _handle_datetime(text, record, column, lino)
-            else:
-                raise Error(f'E110#{lino}:expected an {kind}')
-            column += 1
-        elif c == ']': # end of table
-            if 0 < column < columns:
-                raise Error(f'E120#{lino}:incomplete record {column + 1}/'
-                            f'{columns} fields')
-            return _skip_ws(text[1:], lino)
-        else:
-            raise Error(f'E130#{lino}:invalid character {c!r}')
-        if column == columns:
-            table.append(record)
-            record = None
-    return text, lino
+    table.finalize()
+    return pos, table
 
 
-def _advance(text, column):
-    return text[1:], column + 1
+def _read_records(text, pos, table):
+    parse_row = table._parse_row
+    skip_ws = _WS_RE.match
+    size = len(text)
+    while pos < size:
+        pos = skip_ws(text, pos).end()
+        if pos == size:
+            break
+        if text[pos] == _RBRACKET: # end of table
+            return skip_ws(text, pos + 1).end()
+        pos = parse_row(text, pos)
+    return pos
 
 
-def _handle_null(field_meta, record, column, lino):
+def _h_null(text, pos, field_meta, parser, columns_data, column):
     if not field_meta.null_allowed:
-        raise Error(E140.format(lino=lino, kind=field_meta.kind))
-    record[column] = None
+        raise Error(E140.format(lino=_lino(text, pos),
+                                kind=field_meta.kind))
+    columns_data[column].append(None)
+    return pos + 1, column + 1
+
+
+def _h_false(text, pos, field_meta, parser, columns_data, column):
+    columns_data[column].append(False)
+    return pos + 1, column + 1
+
+
+def _h_true(text, pos, field_meta, parser, columns_data, column):
+    columns_data[column].append(True)
+    return pos + 1, column + 1
+
+
+def _h_bytes(text, pos, field_meta, parser, columns_data, column):
+    return _handle_bytes(text, pos + 1, columns_data, column), column + 1
+
+
+def _h_str(text, pos, field_meta, parser, columns_data, column):
+    return _handle_str(text, pos + 1, columns_data, column), column + 1
+
+
+def _h_value(text, pos, field_meta, parser, columns_data, column):
+    return parser(text, pos, columns_data, column), column + 1
+
+
+def _h_bool_digit(text, pos, field_meta, parser, columns_data, column):
+    # the dispatch guarantees text[pos] is 0 or 1
+    if pos + 1 < len(text) and not _NUMERIC_CHARS[text[pos + 1]]:
+        columns_data[column].append(text[pos] == _ONE)
+        return pos + 1, column + 1
+    _bad_bool(text, pos)
 
 
-def _handle_bool(kind, value, record, column, lino):
-    if kind != 'bool':
-        raise Error(f'E150#{lino}:expected type {kind}, got a bool')
-    record[column] = value
+def _h_bad_bool_digit(text, pos, field_meta, parser, columns_data, column):
+    _bad_bool(text, pos)
 
 
-def _handle_bytes(kind, text, record, column, lino):
-    if kind != 'bytes':
-        raise Error(f'E160#{lino}:expected type {kind}, got a bytes')
-    found, text, lino = _find(text, ')', 'expected to find ")"', lino)
-    record[column] = bytes.fromhex(found)
-    return text, lino # skip )
+def _bad_bool(text, pos):
+    found = text[pos:pos + 2].decode('utf-8', 'replace')
+    raise Error(f'E105#{_lino(text, pos)}:got {found} expected a bool')
 
 
-def _handle_str(kind, text, record, column, lino):
-    if kind != 'str':
-        raise Error(f'E170#{lino}:expected type {kind}, got a str')
-    found, text, lino = _find(text, '>', 'expected to find ">"', lino)
-    record[column] = unescape(found)
-    return text, lino # skip >
+def _h_wrong_bool(text, pos, field_meta, parser, columns_data, column):
+    raise Error(f'E150#{_lino(text, pos)}:expected type '
+                f'{field_meta.kind}, got a bool')
 
 
-def _handle_int(text, record, column, lino):
-    text, found, lino = _scan(text, '-+0123456789', lino)
+def _h_wrong_bytes(text, pos, field_meta, parser, columns_data, column):
+    raise Error(f'E160#{_lino(text, pos)}:expected type '
+                f'{field_meta.kind}, got a bytes')
+
+
+def _h_wrong_str(text, pos, field_meta, parser, columns_data, column):
+    raise Error(f'E170#{_lino(text, pos)}:expected type '
+                f'{field_meta.kind}, got a str')
+
+
+def _h_wrong_minus(text, pos, field_meta, parser, columns_data, column):
+    raise Error(f'E100#{_lino(text, pos)}:expected {field_meta.kind}')
+
+
+def _h_wrong_digit(text, pos, field_meta, parser, columns_data, column):
+    raise Error(f'E110#{_lino(text, pos)}:expected an {field_meta.kind}')
+
+
+def _h_invalid(text, pos, field_meta, parser, columns_data, column):
+    raise Error(f'E130#{_lino(text, pos)}:invalid character '
+                f'{chr(text[pos])!r}')
+
+
+def _make_dispatch(kind):
+    '''Returns a 256-entry handler table for values of the given kind.
+
+    Every slot already knows whether its character suits the kind, so
+    the accepting handlers never have to check it and the rejecting
+    ones raise the same errors the old per-handler checks did.'''
+    dispatch = [_h_invalid] * 256
+    dispatch[ord('?')] = _h_null
+    for c in 'FfNn':
+        dispatch[ord(c)] = _h_false if kind == 'bool' else _h_wrong_bool
+    for c in 'TtYy':
+        dispatch[ord(c)] = _h_true if kind == 'bool' else _h_wrong_bool
+    dispatch[ord('(')] = _h_bytes if kind == 'bytes' else _h_wrong_bytes
+    dispatch[ord('<')] = _h_str if kind == 'str' else _h_wrong_str
+    dispatch[ord('-')] = (_h_value if kind in ('int', 'real')
+                          else _h_wrong_minus)
+    if kind == 'bool':
+        digit = _h_bad_bool_digit
+    elif kind in ('int', 'real', 'date', 'datetime'):
+        digit = _h_value
+    else:
+        digit = _h_wrong_digit
+    for c in '0123456789':
+        dispatch[ord(c)] = digit
+    if kind == 'bool':
+        dispatch[ord('0')] = dispatch[ord('1')] = _h_bool_digit
+    return dispatch
+
+
+_DISPATCH_FOR_KIND = {
+    kind: _make_dispatch(kind)
+    for kind in ('bool', 'bytes', 'date', 'datetime', 'int', 'real',
+                 'str')}
+_DISPATCH_UNKNOWN = _make_dispatch(None)
+
+
+
+def _make_row_parser(table):
+    '''Generates a function that parses one complete record of the given
+    table, with every per-column decision (metadata, parser, column
+    index) burned in at generation time rather than looked up per token.
+
+    Each value is still consumed via its kind's dispatch table so that
+    every error is reported exactly as the generic loop would.'''
+    columns = len(table.fields_meta)
+    lines = ['def parse_row(text, pos, skip_ws=_WS_RE.match']
+    for i in range(columns):
+        lines.append(f'              , dispatch{i}=dispatches[{i}], '
+                     f'meta{i}=metas[{i}], parser{i}=parsers[{i}]')
+    lines.append('              ):')
+    lines.append('    size = len(text)')
+    if not columns:
+        lines.append("    raise Error(f'E130#{_lino(text, pos)}:"
+                     "invalid character '")
+        lines.append("                f'{chr(text[pos])!r}')")
+    for i, meta in enumerate(table.fields_meta):
+        lines.append(f'    # column {i}: {meta.kind}')
+        if i:
+            lines.append('    pos = skip_ws(text, pos).end()')
+            lines.append('    if pos == size:')
+            lines.append('        return pos # drop incomplete row')
+            lines.append('    if text[pos] == 93: # ]')
+            lines.append(f"        raise Error(f'E120#{{_lino(text, pos)}}:"
+                         f"incomplete record {i + 1}/{columns} fields')")
+        lines.append(f'    pos, _ = dispatch{i}[text[pos]](')
+        lines.append(f'        text, pos, meta{i}, parser{i}, '
+                     f'columns_data, {i})')
+    lines.append('    return pos')
+    dispatches = [_DISPATCH_FOR_KIND.get(kind, _DISPATCH_UNKNOWN)
+                  for kind in table._kinds]
+    namespace = dict(_WS_RE=_WS_RE, Error=Error, _lino=_lino,
+                     dispatches=dispatches,
+                     columns_data=table._columns_data,
+                     metas=table.fields_meta, parsers=table._parsers)
+    exec('\n'.join(lines), namespace) # noqa: S102
+    return namespace['parse_row']
+
+
+def _handle_bytes(text, pos, columns_data, column):
+    start, end, pos = _find(text, pos, b')', 'expected to find ")"')
+    columns_data[column].append(bytes.fromhex(text[start:end].decode()))
+    return pos # skip )
+
+
+def _handle_str(text, pos, columns_data, column):
+    start, end, pos = _find(text, pos, b'>', 'expected to find ">"')
+    raw = text[start:end]
+    if b'&' in raw: # only unescape if there's an entity
+        value = _UNESCAPE_RE.sub(_entity_sub, raw.decode('utf-8'))
+    else:
+        value = raw.decode('utf-8')
+    columns_data[column].append(value)
+    return pos # skip >
+
+
+def _entity_sub(match):
+    entity = match.group(1)
+    if entity.startswith('#'):
+        try:
+            return chr(int(entity[1:]))
+        except (ValueError, OverflowError):
+            return match.group(0) # not a code point: leave it as-is
+    return _ENTITY[entity]
+
+
+def _handle_int(text, pos, columns_data, column):
+    start, end, pos = _scan(text, pos, _INT_RE)
+    found = text[start:end]
     try:
-        record[column] = int(found)
-        return text, lino
+        columns_data[column].append(int(found))
+        return pos
     except ValueError as err:
-        raise Error(f'E180#{lino}:invalid int: {found!r}: {err}')
+        raise Error(
+            f'E180#{_lino(text, start)}:invalid int: '
+            f'{found.decode()!r}: {err}')
 
 
-def _handle_real(text, record, column, lino):
-    text, found, lino = _scan(text, '-+0123456789.eE', lino)
+def _handle_real(text, pos, columns_data, column):
+    start, end, pos = _scan(text, pos, _REAL_RE)
+    found = text[start:end]
     try:
-        record[column] = float(found)
-        return text, lino
+        columns_data[column].append(float(found))
+        return pos
     except ValueError as err:
-        raise Error(f'E190#{lino}:invalid real: {found!r}: {err}')
+        raise Error(
+            f'E190#{_lino(text, start)}:invalid real: '
+            f'{found.decode()!r}: {err}')
 
 
-def _handle_date(text, record, column, lino):
-    text, found, lino = _scan(text, '-0123456789', lino)
+def _handle_date(text, pos, columns_data, column):
+    start, end, pos = _scan(text, pos, _DATE_RE)
+    raw = text[start:end]
     try:
-        record[column] = datetime.date.fromisoformat(found)
-        return text, lino
+        if len(raw) == 10 and raw[4] == _HYPHEN and raw[7] == _HYPHEN:
+            # the common YYYY-MM-DD shape: skip fromisoformat's
+            # general-purpose validation
+            value = datetime.date(int(raw[:4]), int(raw[5:7]),
+                                  int(raw[8:10]))
+        else:
+            value = datetime.date.fromisoformat(raw.decode())
+        columns_data[column].append(value)
+        return pos
     except ValueError as err:
-        raise Error(f'E200#{lino}:invalid date: {found!r}: {err}')
+        raise Error(f'E200#{_lino(text, start)}:invalid date: '
+                    f'{raw.decode()!r}: {err}')
 
 
-def _handle_datetime(text, record, column, lino):
-    text, found, lino = _scan(text, '-0123456789T:', lino)
+def _handle_datetime(text, pos, columns_data, column):
+    start, end, pos = _scan(text, pos, _DATETIME_RE)
+    raw = text[start:end]
     try:
-        record[column] = datetime.datetime.fromisoformat(found)
-        return text, lino
+        if (len(raw) == 19 and raw[4] == _HYPHEN and raw[7] == _HYPHEN and
+                raw[10] == _T_SEP and raw[13] == _COLON and
+                raw[16] == _COLON):
+            # the common YYYY-MM-DDTHH:MM:SS shape
+            value = datetime.datetime(
+                int(raw[:4]), int(raw[5:7]), int(raw[8:10]),
+                int(raw[11:13]), int(raw[14:16]), int(raw[17:19]))
+        else:
+            value = datetime.datetime.fromisoformat(raw.decode())
+        columns_data[column].append(value)
+        return pos
     except ValueError as err:
-        raise Error(f'E210#{lino}:invalid datetime: {found!r}: {err}')
-
-
-def _scan(text, valid, lino):
-    text, lino = _skip_ws(text, lino)
-    end = 0
-    while end < len(text):
-        c = text[end]
-        if c not in valid:
-            return text[end:], text[:end], lino
-        end += 1
-    raise Error(f'E220#{lino}:unexpected end of data')
-
-
-def _skip_ws(text, lino):
-    end = 0
-    while end < len(text):
-        c = text[end]
-        if c == '\n':
-            lino += 1
-        if c.isspace():
-            end += 1
-            continue
-        return text[end:], lino
-    return text, lino
-
-
-def _find(text, what, message, lino):
-    end = text.find(what)
+        raise Error(f'E210#{_lino(text, start)}:invalid datetime: '
+                    f'{raw.decode()!r}: {err}')
+
+
+_PARSER_FOR_KIND = {'int': _handle_int, 'real': _handle_real,
+                    'date': _handle_date, 'datetime': _handle_datetime}
+
+
+def _scan(text, pos, rx):
+    match = rx.match(text, pos)
+    end = match.end()
+    if end == len(text):
+        raise Error(f'E220#{_lino(text, pos)}:unexpected end of data')
+    return match.start(1), end, end
+
+
+def _find(text, pos, what, message):
+    end = text.find(what, pos)
     if end == -1:
-        raise Error(f'E230#{lino}:{message}')
-    lino += text[:end].count('\n')
-    return text[:end], text[end + 1:], lino
+        raise Error(f'E230#{_lino(text, pos)}:{message}')
+    return pos, end, end + 1
+
+
+def _lino(text, pos):
+    '''Returns the 1-based line number at pos.
+
+    Every parse error is fatal, so the line number is counted once here,
+    on demand, instead of being tracked throughout parsing.'''
+    count = getattr(text, 'count', None) # mmap.mmap has no count method
+    if count is not None:
+        return count(b'\n', 0, pos) + 1
+    lino = 1
+    i = text.find(b'\n', 0, pos)
+    while i != -1:
+        lino += 1
+        i = text.find(b'\n', i + 1, pos)
+    return lino
 
 
 def _write_tdb(out, tables, decimals):
@@ -379,16 +542,37 @@ class Table:
     def __init__(self):
         self.name = None
         self.fields_meta = []
-        self.records = []
-        self._RecordClass = None
+        self._records = []
+        self._columns_data = None # per-column value lists while parsing
+        self.RecordClass = None
+        self._kinds = []
+        self._parsers = []
+        self._parse_row = None
+
+
+    def finalize(self):
+        '''Precomputes the per-column data the record parser relies on;
+        called once the metadata is complete.'''
+        self.RecordClass = editabletuple.editabletuple(
+            self.name, *[meta.name for meta in self.fields_meta])
+        self._kinds = [meta.kind for meta in self.fields_meta]
+        self._parsers = [_PARSER_FOR_KIND.get(kind) for kind in self._kinds]
+        self._columns_data = [[] for _ in self.fields_meta]
+        self._parse_row = _make_row_parser(self)
 
 
     @property
-    def RecordClass(self):
-        if self._RecordClass is None:
-            self._RecordClass = editabletuple.editabletuple(
-                self.name, *[field.name for field in self.fields_meta])
-        return self._RecordClass
+    def records(self):
+        '''The table's records as a list of RecordClass instances.
+
+        The parser stores values one list per column; the records are
+        only materialized (once) when they're actually wanted.'''
+        if self._columns_data is not None:
+            Class = self.RecordClass
+            self._records = [
+                Class(*values) for values in zip(*self._columns_data)]
+            self._columns_data = None
+        return self._records
 
 
     @property
@@ -54,20 +54,64 @@ class TestTdb(unittest.TestCase):
         self.assertEqual(expected, actual)
 
 
+    def test_entities(self):
+        db = tdb.loads('[T S str\n%\n<&lt;&gt;&amp;&quot;&apos;&#65;>\n]')
+        record = next(iter(db.tables['T']))
+        self.assertEqual(record.S, '<>&"\'A')
+
+
+    def test_entities_passthrough(self):
+        # unrecognized or out-of-range references are kept as-is
+        db = tdb.loads(
+            '[T S str\n%\n<&unknown; &#x41; &#1114112;>\n]')
+        record = next(iter(db.tables['T']))
+        self.assertEqual(record.S, '&unknown; &#x41; &#1114112;')
+
+
     def test_e100(self):
         with self.assertRaises(tdb.Error) as ctx:
             tdb.loads('[T A bool\n%\n-3]')
         err = ctx.exception
-        m = re.search(r'^E(\d\d\d)#', str(err))
+        m = re.search(r'^E(\d\d\d)#(\d+):', str(err))
         self.assertTrue(m is not None and m.group(1) == '100')
+        self.assertEqual(m.group(2), '3')
 
 
     def test_e105(self):
         with self.assertRaises(tdb.Error) as ctx:
             tdb.loads('[T A bool\n%\n2]')
         err = ctx.exception
-        m = re.search(r'^E(\d\d\d)#', str(err))
+        m = re.search(r'^E(\d\d\d)#(\d+):', str(err))
         self.assertTrue(m is not None and m.group(1) == '105')
+        self.assertEqual(m.group(2), '3')
+
+
+    def test_e120(self):
+        with self.assertRaises(tdb.Error) as ctx:
+            tdb.loads('[T A int B int\n%\n1 2\n3]')
+        err = ctx.exception
+        m = re.search(r'^E(\d\d\d)#(\d+):', str(err))
+        self.assertTrue(m is not None and m.group(1) == '120')
+        self.assertEqual(m.group(2), '4')
+
+
+    def test_e180(self):
+        with self.assertRaises(tdb.Error) as ctx:
+            tdb.loads('[T A int\n%\n1\n--3 4]')
+        err = ctx.exception
+        m = re.search(r'^E(\d\d\d)#(\d+):', str(err))
+        self.assertTrue(m is not None and m.group(1) == '180')
+        self.assertEqual(m.group(2), '4')
+        self.assertIn("'--3'", str(err))
+
+
+    def test_e220(self):
+        with self.assertRaises(tdb.Error) as ctx:
+            tdb.loads('[T A int\n%\n1\n23')
+        err = ctx.exception
+        m = re.search(r'^E(\d\d\d)#(\d+):', str(err))
+        self.assertTrue(m is not None and m.group(1) == '220')
+        self.assertEqual(m.group(2), '4')
 
 
 